@@ -0,0 +1,431 @@
+# Loading Packages
+import sys
+import json
+import logging
+import uuid
+import click
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parents[1] / "scripts"))
+from schema import REMUNERATIONS, read_csv  # noqa: E402
+
+# Constants
+DATA = Path.cwd() / "data"
+REMUNERATIONS_FILE = DATA / "processed" / "all_remunerations.csv"
+INDEX = DATA / "processed" / "remuneration_index"
+NAME_FIELDS = ["surname", "given_name"]
+EMPTY_SLOT = -1
+PREFIX_UPPER_BOUND = "\U0010ffff"
+
+Index = Dict[str, np.ndarray]
+
+
+# Helper Functions
+def uuid_words(employee_id: str) -> np.ndarray:
+    """
+    Convert an employee ID into two unsigned 64-bit words.
+
+    Args:
+        employee_id (str): An employee UUID (e.g., "5f0c...-...").
+
+    Returns:
+        np.ndarray: The UUID's 16 bytes as two uint64 words.
+    """
+    return np.frombuffer(uuid.UUID(str(employee_id)).bytes, dtype=np.uint64)
+
+
+def words_to_uuid(words: np.ndarray) -> str:
+    """
+    Convert two unsigned 64-bit words back into an employee ID.
+
+    Args:
+        words (np.ndarray): Two uint64 words, as returned by `uuid_words`.
+
+    Returns:
+        str: The employee UUID.
+    """
+    return str(uuid.UUID(bytes=np.ascontiguousarray(words).tobytes()))
+
+
+def build_id_slots(ids: np.ndarray, id_na: np.ndarray) -> np.ndarray:
+    """
+    Build an open-addressing hash table mapping employee IDs to row positions.
+
+    Args:
+        ids (np.ndarray): An (n, 2) uint64 array of employee IDs.
+        id_na (np.ndarray): A boolean array marking rows without an ID, which are left out.
+
+    Returns:
+        np.ndarray: A table of row positions, with `EMPTY_SLOT` for unused slots.
+
+    Description:
+        The table has a power-of-two size of at least twice the number of rows.
+        Slots are addressed by the first word of each UUID and collisions are
+        resolved by linear probing.
+    """
+    capacity = 1 << max(1, int(2 * len(ids) - 1).bit_length())
+    mask = capacity - 1
+    slots = np.full(capacity, EMPTY_SLOT, dtype=np.int32)
+    for row in np.flatnonzero(~id_na).tolist():
+        slot = int(ids[row, 0]) & mask
+        while slots[slot] != EMPTY_SLOT:
+            slot = (slot + 1) & mask
+        slots[slot] = row
+    return slots
+
+
+def build_prefix_index(names: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build a sorted, case-insensitive key array for prefix searches.
+
+    Args:
+        names (pd.Series): Names to index.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The sorted keys and their row positions.
+    """
+    keys = names.fillna("").str.casefold().to_numpy(dtype=str)
+    order = np.argsort(keys, kind="stable").astype(np.int32)
+    return keys[order], order
+
+
+def build_index(df: pd.DataFrame) -> Index:
+    """
+    Build query index arrays from a processed remuneration table.
+
+    Args:
+        df (pd.DataFrame): A processed remuneration table (see `remuneration_table_processing.py`).
+
+    Returns:
+        Index: A dictionary of NumPy arrays backing the query functions.
+
+    Note:
+        - Rows with a missing remuneration are excluded from range and top-k queries.
+        - Rows with a missing ID are excluded from ID lookups.
+    """
+    remuneration = df["remuneration"].fillna(0).to_numpy(dtype=np.int32)
+    remuneration_na = df["remuneration"].isna().to_numpy()
+    remuneration_order = np.flatnonzero(~remuneration_na)
+    remuneration_order = remuneration_order[
+        np.argsort(remuneration[remuneration_order], kind="stable")
+    ].astype(np.int32)
+    id_na = df["id"].isna().to_numpy()
+    ids = np.zeros((len(df), 2), dtype=np.uint64)
+    if (~id_na).any():
+        ids[~id_na] = np.frombuffer(
+            b"".join(df["id"][~id_na]), dtype=np.uint64
+        ).reshape(-1, 2)
+    if id_na.any():
+        logging.warning(
+            f"{id_na.sum()} rows have no ID and cannot be looked up by ID:\n"
+            f"{df.loc[id_na, ['name', 'remuneration']].to_string()}"
+        )
+
+    index = {
+        "ids": ids,
+        "id_na": id_na,
+        "id_slots": build_id_slots(ids, id_na),
+        "name": df["name"].fillna("").to_numpy(dtype=str),
+        "given_name": df["given_name"].fillna("").to_numpy(dtype=str),
+        "surname": df["surname"].fillna("").to_numpy(dtype=str),
+        "remuneration": remuneration,
+        "remuneration_na": remuneration_na,
+        "expenses": df["expenses"].fillna(0).to_numpy(dtype=np.int32),
+        "expenses_na": df["expenses"].isna().to_numpy(),
+        "remuneration_order": remuneration_order,
+        "remuneration_sorted": remuneration[remuneration_order],
+    }
+    for field in NAME_FIELDS:
+        index[f"{field}_keys"], index[f"{field}_order"] = build_prefix_index(df[field])
+    return index
+
+
+def source_fingerprint(source: Path) -> Dict[str, object]:
+    """
+    Describe the CSV file an index is built from.
+
+    Args:
+        source (Path): The processed remunerations CSV file.
+
+    Returns:
+        Dict[str, object]: The file's resolved path, modification time and size,
+        or only its path if the file does not exist.
+    """
+    source = source.resolve()
+    if not source.exists():
+        return {"path": str(source)}
+    stat = source.stat()
+    return {"path": str(source), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def save_index(index: Index, path: Path, source: Path) -> None:
+    """
+    Save index arrays as `.npy` files so they can be memory-mapped.
+
+    Args:
+        index (Index): Index arrays, as returned by `build_index`.
+        path (Path): The directory where the index will be saved.
+        source (Path): The CSV file the index was built from, recorded in the manifest.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    for name, array in index.items():
+        np.save(path / f"{name}.npy", array)
+    with (path / "manifest.json").open(mode="w") as f:
+        json.dump(
+            {
+                "arrays": sorted(index),
+                "rows": len(index["ids"]),
+                "source": source_fingerprint(source),
+            },
+            f,
+        )
+
+
+def load_index(path: Path = INDEX) -> Index:
+    """
+    Load a saved index without reading its arrays into memory.
+
+    Args:
+        path (Path): The directory containing the saved index.
+
+    Returns:
+        Index: Memory-mapped index arrays.
+
+    Note:
+        - A warning is logged if the source CSV has changed since the index was built,
+          since `remuneration_table_processing.py` assigns new IDs on every run.
+    """
+    with (path / "manifest.json").open(mode="r") as f:
+        manifest = json.load(f)
+
+    source = manifest.get("source")
+    if source is None:
+        logging.warning(f"The index at {path} does not record its source; rebuild it.")
+    elif source_fingerprint(Path(source["path"])) != source:
+        logging.warning(
+            f"{source['path']} has changed since the index at {path} was built; "
+            "results may be stale. Rebuild the index."
+        )
+
+    return {
+        name: np.load(path / f"{name}.npy", mmap_mode="r")
+        for name in manifest["arrays"]
+    }
+
+
+def rows_at(index: Index, positions: np.ndarray) -> pd.DataFrame:
+    """
+    Materialize the rows at the given positions.
+
+    Args:
+        index (Index): Index arrays.
+        positions (np.ndarray): Row positions.
+
+    Returns:
+        pd.DataFrame: The selected rows, in the order of `positions`.
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    remuneration = pd.array(index["remuneration"][positions], dtype="Int32")
+    remuneration[index["remuneration_na"][positions]] = pd.NA
+    expenses = pd.array(index["expenses"][positions], dtype="Int32")
+    expenses[index["expenses_na"][positions]] = pd.NA
+    return pd.DataFrame(
+        {
+            "id": [
+                None if index["id_na"][p] else words_to_uuid(index["ids"][p])
+                for p in positions
+            ],
+            "name": index["name"][positions],
+            "given_name": index["given_name"][positions],
+            "surname": index["surname"][positions],
+            "remuneration": remuneration,
+            "expenses": expenses,
+        }
+    )
+
+
+# Query Functions
+def find_by_id(index: Index, employee_id: str) -> pd.DataFrame:
+    """
+    Look up an employee by ID.
+
+    Args:
+        index (Index): Index arrays.
+        employee_id (str): The employee UUID.
+
+    Returns:
+        pd.DataFrame: The matching row, or an empty DataFrame if there is none.
+
+    Raises:
+        ValueError: If `employee_id` is not a valid UUID.
+    """
+    key = uuid_words(employee_id)
+    slots = index["id_slots"]
+    mask = len(slots) - 1
+    slot = int(key[0]) & mask
+    while (row := int(slots[slot])) != EMPTY_SLOT:
+        if np.array_equal(index["ids"][row], key):
+            return rows_at(index, [row])
+        slot = (slot + 1) & mask
+    return rows_at(index, [])
+
+
+def remuneration_between(
+    index: Index, low: int, high: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Find employees whose remuneration falls within an inclusive range.
+
+    Args:
+        index (Index): Index arrays.
+        low (int): The lower bound of the range.
+        high (Optional[int]): The upper bound of the range, or None for no upper bound.
+
+    Returns:
+        pd.DataFrame: The matching rows, in descending order of remuneration.
+    """
+    remuneration_sorted = index["remuneration_sorted"]
+    start = np.searchsorted(remuneration_sorted, low, side="left")
+    if high is None:
+        stop = len(remuneration_sorted)
+    else:
+        stop = np.searchsorted(remuneration_sorted, high, side="right")
+    return rows_at(index, index["remuneration_order"][start:stop][::-1])
+
+
+def top_remunerations(index: Index, k: int) -> pd.DataFrame:
+    """
+    Find the employees with the k largest remunerations.
+
+    Args:
+        index (Index): Index arrays.
+        k (int): The number of rows to return.
+
+    Returns:
+        pd.DataFrame: The top k rows, in descending order of remuneration.
+    """
+    order = index["remuneration_order"]
+    return rows_at(index, order[max(len(order) - k, 0) :][::-1])
+
+
+def search_name_prefix(
+    index: Index, prefix: str, field: str = "surname"
+) -> pd.DataFrame:
+    """
+    Find employees whose surname or given name starts with a prefix.
+
+    Args:
+        index (Index): Index arrays.
+        prefix (str): The case-insensitive name prefix.
+        field (str): The name field to search, either "surname" or "given_name".
+
+    Returns:
+        pd.DataFrame: The matching rows, in alphabetical order of `field`.
+    """
+    keys = index[f"{field}_keys"]
+    prefix = prefix.casefold()
+    start = np.searchsorted(keys, prefix, side="left")
+    stop = np.searchsorted(keys, prefix + PREFIX_UPPER_BOUND, side="left")
+    return rows_at(index, index[f"{field}_order"][start:stop])
+
+
+def validate_employee_id(ctx, param, value):
+    """
+    Validate an employee ID given on the command line.
+
+    Args:
+        ctx (click.Context): The click context.
+        param (click.Parameter): The parameter being validated.
+        value (str): The employee ID.
+
+    Returns:
+        str: The employee ID, if it is a valid UUID.
+
+    Raises:
+        click.BadParameter: If the employee ID is not a valid UUID.
+    """
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        raise click.BadParameter(f"{value!r} is not a valid employee UUID.")
+    return value
+
+
+def echo_rows(rows: pd.DataFrame) -> None:
+    """
+    Display query results.
+
+    Args:
+        rows (pd.DataFrame): The rows to display.
+    """
+    if rows.empty:
+        click.echo(message=click.style("No matches", fg="red"))
+    else:
+        click.echo(message=rows.to_string(index=False))
+
+
+# Main Function
+@click.group()
+@click.option(
+    "--index-path",
+    type=click.Path(path_type=Path),
+    default=INDEX,
+    show_default=True,
+    help="Directory of the saved index.",
+)
+@click.pass_context
+def main(ctx, index_path):
+    ctx.obj = index_path
+
+
+@main.command()
+@click.pass_obj
+def build(index_path):
+    """Build the index from the processed remunerations."""
+    index = build_index(read_csv(REMUNERATIONS_FILE, REMUNERATIONS))
+    save_index(index, index_path, source=REMUNERATIONS_FILE)
+    click.echo(message=f"Index saved to {index_path}")
+
+
+@main.command(name="id")
+@click.argument("employee_id", callback=validate_employee_id)
+@click.pass_obj
+def id_command(index_path, employee_id):
+    """Look up an employee by ID."""
+    echo_rows(find_by_id(load_index(index_path), employee_id))
+
+
+@main.command(name="range")
+@click.argument("low", type=int)
+@click.argument("high", type=int, required=False)
+@click.pass_obj
+def range_command(index_path, low, high):
+    """List employees with a remuneration between LOW and HIGH (or above LOW)."""
+    echo_rows(remuneration_between(load_index(index_path), low, high))
+
+
+@main.command()
+@click.option("-k", type=int, default=10, show_default=True)
+@click.pass_obj
+def top(index_path, k):
+    """List the employees with the largest remunerations."""
+    echo_rows(top_remunerations(load_index(index_path), k))
+
+
+@main.command()
+@click.argument("prefix")
+@click.option(
+    "--field", type=click.Choice(NAME_FIELDS), default="surname", show_default=True
+)
+@click.pass_obj
+def prefix(index_path, prefix, field):
+    """List employees whose name starts with PREFIX."""
+    echo_rows(search_name_prefix(load_index(index_path), prefix, field))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 # Loading Libraries
+import sys
 import tabula
 import tomllib
 import pandas as pd
@@ -6,6 +7,9 @@ import pandas as pd
 from pathlib import Path
 from typing import Dict, Any, List
 
+sys.path.append(str(Path(__file__).parents[1]))
+from schema import STRING_DTYPE  # noqa: E402
+
 # Constants
 ROOT = Path.cwd()
 CONFIG_FILE = ROOT / "config.toml"
@@ -137,4 +141,5 @@ if __name__ == "__main__":
         )
         raw_remunerations_table = pd.concat([raw_remunerations_table, *parsed_tables])
 
-    raw_remunerations_table.to_csv(OUTPUT, index=False)
+    # Raw cells are kept as strings; typing happens in remuneration_table_processing.py
+    raw_remunerations_table.astype(STRING_DTYPE).to_csv(OUTPUT, index=False)
@@ -1,9 +1,13 @@
 # Loading Library
 import re
+import sys
 import pandas as pd
 
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parents[1]))
+from schema import PROFESSOR_DIRECTORY, to_csv  # noqa: E402
+
 # Constants
 DATA = Path(__file__).parents[2] / "data"
 INPUT = DATA / "raw" / "raw_professor_directory.html"
@@ -125,4 +129,4 @@ if __name__ == "__main__":
     cleaned_data = process_names(cleaned_data)
 
     # Save the cleaned data to a CSV file
-    cleaned_data.to_csv(OUTPUT, index=False)
+    to_csv(cleaned_data, OUTPUT, schema=PROFESSOR_DIRECTORY)
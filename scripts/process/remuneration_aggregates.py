@@ -0,0 +1,310 @@
+# Loading Libraries
+import sys
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+from typing import Dict, Any, List
+
+sys.path.append(str(Path(__file__).parents[1]))
+from schema import REMUNERATIONS, read_csv, to_csv  # noqa: E402
+
+# Constants
+DATA = Path.cwd() / "data"
+INPUT = DATA / "processed" / "all_remunerations.csv"
+AGGREGATES = DATA / "processed" / "aggregates"
+FISCAL_YEAR = "2022"
+COMBINED = "all_years"
+
+TOP_K = 10
+BIN_WIDTH = 1_000  # Dollars per histogram bin
+QUANTILES = [0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+TOP_COLUMNS = ["fiscal_year", "id", "name", "remuneration", "expenses"]
+POWERS_OF_TEN = 10 ** np.arange(19, dtype=np.int64)
+BENFORD_DIGITS = np.arange(1, 10)
+
+
+# Helper Functions
+def non_null_values(series: pd.Series) -> np.ndarray:
+    """
+    Convert a monetary column into a NumPy integer array, dropping missing values.
+
+    Args:
+        series (pd.Series): A monetary column (e.g., remuneration or expenses).
+
+    Returns:
+        np.ndarray: The non-null values as a 64-bit integer array.
+    """
+    return series.dropna().to_numpy(dtype=np.int64)
+
+
+def top_k(df: pd.DataFrame, column: str, k: int = TOP_K) -> pd.DataFrame:
+    """
+    Select the k rows with the largest values in a column.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to select rows from.
+        column (str): The column to rank rows by.
+        k (int): The number of rows to retain.
+
+    Returns:
+        pd.DataFrame: The top k rows, sorted in descending order of `column`.
+
+    Description:
+        Rows are partitioned with `np.argpartition`, so only the k retained rows are sorted.
+        Rows with a missing value in `column` are never selected.
+    """
+    candidates = df[df[column].notna()]
+    values = non_null_values(candidates[column])
+    if values.size > k:
+        positions = np.argpartition(-values, kth=k - 1)[:k]
+    else:
+        positions = np.arange(values.size)
+    positions = positions[np.argsort(-values[positions], kind="stable")]
+    return candidates.iloc[positions][TOP_COLUMNS].reset_index(drop=True)
+
+
+def histogram_counts(values: np.ndarray, bin_width: int = BIN_WIDTH) -> np.ndarray:
+    """
+    Count values into fixed-width bins starting at zero.
+
+    Args:
+        values (np.ndarray): Non-negative integer values.
+        bin_width (int): The width of each bin.
+
+    Returns:
+        np.ndarray: Counts per bin, where bin i covers [i * bin_width, (i + 1) * bin_width).
+    """
+    return np.bincount(values // bin_width).astype(np.int64)
+
+
+def first_digits(values: np.ndarray) -> np.ndarray:
+    """
+    Extract the leading digit of each positive integer.
+
+    Args:
+        values (np.ndarray): Integer values.
+
+    Returns:
+        np.ndarray: The leading digit (1-9) of each positive value.
+    """
+    values = values[values > 0]
+    magnitude = np.searchsorted(POWERS_OF_TEN, values, side="right") - 1
+    return values // POWERS_OF_TEN[magnitude]
+
+
+def first_digit_counts(values: np.ndarray) -> np.ndarray:
+    """
+    Count the occurrences of each leading digit.
+
+    Args:
+        values (np.ndarray): Integer values.
+
+    Returns:
+        np.ndarray: Counts of leading digits 1 through 9.
+    """
+    return np.bincount(first_digits(values), minlength=10)[1:].astype(np.int64)
+
+
+def histogram_quantiles(
+    counts: np.ndarray, quantiles: List[float], bin_width: int = BIN_WIDTH
+) -> np.ndarray:
+    """
+    Estimate quantiles from fixed-width histogram counts.
+
+    Args:
+        counts (np.ndarray): Counts per bin, as returned by `histogram_counts`.
+        quantiles (List[float]): Quantiles to estimate, between 0 and 1.
+        bin_width (int): The width of each bin.
+
+    Returns:
+        np.ndarray: The estimated quantiles, linearly interpolated within bins,
+        or NaN if the histogram is empty.
+
+    Note:
+        - Estimates are accurate to within `bin_width`, which keeps them mergeable across years.
+    """
+    if counts.sum() == 0:
+        return np.full(len(quantiles), np.nan)
+    cumulative = np.cumsum(counts)
+    targets = np.asarray(quantiles) * cumulative[-1]
+    bins = np.searchsorted(cumulative, targets, side="left")
+    below = np.where(bins > 0, cumulative[bins - 1], 0)
+    fraction = (targets - below) / np.maximum(counts[bins], 1)
+    return (bins + fraction) * bin_width
+
+
+def pad_to(counts: np.ndarray, size: int) -> np.ndarray:
+    """
+    Right-pad a count array with zeros.
+
+    Args:
+        counts (np.ndarray): The counts to pad.
+        size (int): The length of the padded array.
+
+    Returns:
+        np.ndarray: The padded counts.
+    """
+    return np.pad(counts, (0, size - counts.size))
+
+
+# Aggregation Functions
+def compute_aggregates(df: pd.DataFrame, fiscal_year: int) -> Dict[str, Any]:
+    """
+    Compute mergeable summary aggregates for a processed remuneration table.
+
+    Args:
+        df (pd.DataFrame): A processed remuneration table (see `remuneration_table_processing.py`).
+        fiscal_year (int): The fiscal year of the table, recorded on the top remuneration and expenses rows.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the top remunerations, top expenses,
+        remuneration histogram counts and leading digit counts.
+    """
+    df = df.assign(fiscal_year=fiscal_year)
+    remunerations = non_null_values(df["remuneration"])
+    return {
+        "top_remuneration": top_k(df, column="remuneration"),
+        "top_expenses": top_k(df, column="expenses"),
+        "histogram": histogram_counts(remunerations),
+        "first_digits": first_digit_counts(remunerations),
+    }
+
+
+def merge_aggregates(aggregates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge aggregates from several fiscal years without revisiting their raw rows.
+
+    Args:
+        aggregates (List[Dict[str, Any]]): Aggregates as returned by `compute_aggregates`.
+
+    Returns:
+        Dict[str, Any]: The combined aggregates.
+
+    Note:
+        - Top rows keep their 'fiscal_year', so an employee may appear once per year.
+    """
+    size = max(aggregate["histogram"].size for aggregate in aggregates)
+    return {
+        "top_remuneration": top_k(
+            pd.concat([a["top_remuneration"] for a in aggregates]), "remuneration"
+        ),
+        "top_expenses": top_k(
+            pd.concat([a["top_expenses"] for a in aggregates]), "expenses"
+        ),
+        "histogram": sum(pad_to(a["histogram"], size) for a in aggregates),
+        "first_digits": sum(a["first_digits"] for a in aggregates),
+    }
+
+
+def histogram_table(counts: np.ndarray) -> pd.DataFrame:
+    """
+    Convert histogram counts into a table of non-empty bins.
+
+    Args:
+        counts (np.ndarray): Counts per bin.
+
+    Returns:
+        pd.DataFrame: A table with 'bin_start', 'bin_end' and 'n' columns.
+    """
+    bins = np.flatnonzero(counts)
+    return pd.DataFrame(
+        {
+            "bin_start": bins * BIN_WIDTH,
+            "bin_end": (bins + 1) * BIN_WIDTH,
+            "n": counts[bins],
+        }
+    )
+
+
+def benford_table(counts: np.ndarray) -> pd.DataFrame:
+    """
+    Build a table comparing observed leading digits with Benford's law.
+
+    Args:
+        counts (np.ndarray): Counts of leading digits 1 through 9.
+
+    Returns:
+        pd.DataFrame: A table with 'first_digit', 'n', 'percent' and 'expected' columns.
+    """
+    total = counts.sum()
+    return pd.DataFrame(
+        {
+            "first_digit": BENFORD_DIGITS,
+            "n": counts,
+            "percent": counts / total if total else np.nan,
+            "expected": np.log10(1 + 1 / BENFORD_DIGITS),
+        }
+    )
+
+
+def quantile_table(counts: np.ndarray) -> pd.DataFrame:
+    """
+    Build a table of remuneration quantiles estimated from histogram counts.
+
+    Args:
+        counts (np.ndarray): Counts per bin.
+
+    Returns:
+        pd.DataFrame: A table with 'quantile' and 'remuneration' columns.
+    """
+    return pd.DataFrame(
+        {"quantile": QUANTILES, "remuneration": histogram_quantiles(counts, QUANTILES)}
+    )
+
+
+def save_aggregates(aggregates: Dict[str, Any], path: Path) -> None:
+    """
+    Save aggregates as small CSV files.
+
+    Args:
+        aggregates (Dict[str, Any]): Aggregates as returned by `compute_aggregates`.
+        path (Path): The directory where the CSV files will be saved.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    to_csv(aggregates["top_remuneration"], path / "top_remuneration.csv", REMUNERATIONS)
+    to_csv(aggregates["top_expenses"], path / "top_expenses.csv", REMUNERATIONS)
+    histogram_table(aggregates["histogram"]).to_csv(
+        path / "remuneration_histogram.csv", index=False
+    )
+    quantile_table(aggregates["histogram"]).to_csv(
+        path / "remuneration_quantiles.csv", index=False
+    )
+    benford_table(aggregates["first_digits"]).to_csv(path / "benford.csv", index=False)
+
+
+def load_aggregates(path: Path) -> Dict[str, Any]:
+    """
+    Load aggregates previously saved by `save_aggregates`.
+
+    Args:
+        path (Path): The directory containing the aggregate CSV files.
+
+    Returns:
+        Dict[str, Any]: The loaded aggregates.
+    """
+    histogram = pd.read_csv(path / "remuneration_histogram.csv")
+    size = histogram["bin_end"].max() // BIN_WIDTH if len(histogram) else 0
+    counts = np.zeros(size, dtype=np.int64)
+    counts[histogram["bin_start"] // BIN_WIDTH] = histogram["n"]
+    return {
+        "top_remuneration": read_csv(path / "top_remuneration.csv", REMUNERATIONS),
+        "top_expenses": read_csv(path / "top_expenses.csv", REMUNERATIONS),
+        "histogram": counts,
+        "first_digits": pd.read_csv(path / "benford.csv")["n"].to_numpy(np.int64),
+    }
+
+
+if __name__ == "__main__":
+    remunerations_table = read_csv(INPUT, REMUNERATIONS)
+    save_aggregates(
+        compute_aggregates(remunerations_table, fiscal_year=int(FISCAL_YEAR)),
+        AGGREGATES / FISCAL_YEAR,
+    )
+
+    yearly_aggregates = [
+        load_aggregates(path)
+        for path in sorted(AGGREGATES.iterdir())
+        if path.is_dir() and path.name != COMBINED
+    ]
+    save_aggregates(merge_aggregates(yearly_aggregates), AGGREGATES / COMBINED)
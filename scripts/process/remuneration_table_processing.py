@@ -1,10 +1,22 @@
 # Loading Libraries
+import sys
 import numpy as np
 import pandas as pd
 
 from uuid import uuid4
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parents[1]))
+from schema import (  # noqa: E402
+    ID_DTYPE,
+    MONEY_COLUMNS,
+    REMUNERATIONS,
+    STRING_DTYPE,
+    apply_schema,
+    report_coercion_failures,
+    to_csv,
+)
+
 
 # Constants
 DATA = Path.cwd() / "data"
@@ -157,11 +169,9 @@ def process_table(table: pd.DataFrame) -> pd.DataFrame:
         ",", "", regex=True
     )
 
-    # Step 6: Type casting columns
-    type_casted_df = na_replace_df.astype(
-        dtype={"remuneration": "int32", "expenses": "int32"},
-        errors="ignore",  # Prevent ValueError from casting NaN values
-    )
+    # Step 6: Type casting columns (values that fail coercion are reported and set to NA)
+    type_casted_df, failures = apply_schema(na_replace_df, schema=MONEY_COLUMNS)
+    report_coercion_failures(failures, source="remuneration table")
 
     # Step 7: Split names into given and surname columns
     name_columns = ["surname", "given_name"]
@@ -173,14 +183,16 @@ def process_table(table: pd.DataFrame) -> pd.DataFrame:
 
 
 if __name__ == "__main__":
-    raw_remunerations_table = pd.read_csv(INPUT)
+    raw_remunerations_table = pd.read_csv(INPUT, dtype=STRING_DTYPE)
     processed_remunerations_table = process_table(raw_remunerations_table)
 
     processed_remunerations_table["id"] = pd.Series(
-        data=[uuid4() for _ in range(processed_remunerations_table.shape[0])]
+        data=[uuid4().bytes for _ in range(processed_remunerations_table.shape[0])],
+        index=processed_remunerations_table.index,
+        dtype=ID_DTYPE,
     )
 
     column_order = ["id", "name", "given_name", "surname", "remuneration", "expenses"]
     processed_remunerations_table = processed_remunerations_table[column_order]
 
-    processed_remunerations_table.to_csv(OUTPUT, index=False)
+    to_csv(processed_remunerations_table, OUTPUT, schema=REMUNERATIONS)
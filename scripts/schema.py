@@ -0,0 +1,256 @@
+# Loading Libraries
+import uuid
+import logging
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Constants
+DATA = Path.cwd() / "data"
+REMUNERATIONS_FILE = DATA / "processed" / "all_remunerations.csv"
+
+MONEY_DTYPE = pd.Int32Dtype()
+STRING_DTYPE = pd.StringDtype(storage="pyarrow")
+ID_DTYPE = pd.ArrowDtype(pa.binary(16))
+INT32_MIN, INT32_MAX = np.iinfo(np.int32).min, np.iinfo(np.int32).max
+
+# Schemas
+Schema = Dict[str, object]
+
+REMUNERATIONS: Schema = {
+    "id": ID_DTYPE,
+    "name": STRING_DTYPE,
+    "given_name": STRING_DTYPE,
+    "surname": STRING_DTYPE,
+    "remuneration": MONEY_DTYPE,
+    "expenses": MONEY_DTYPE,
+}
+MONEY_COLUMNS: Schema = {"remuneration": MONEY_DTYPE, "expenses": MONEY_DTYPE}
+PROFESSOR_DIRECTORY: Schema = {
+    "name": STRING_DTYPE,
+    "title": STRING_DTYPE,
+    "department": STRING_DTYPE,
+}
+
+
+# Helper Functions
+def coerce_money(series: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    Strictly coerce a column into nullable 32-bit integers.
+
+    Args:
+        series (pd.Series): The column to coerce.
+
+    Returns:
+        Tuple[pd.Series, pd.Series]: The coerced column, and a boolean Series marking
+        values that were present but could not be represented as whole 32-bit integers.
+    """
+    numbers = pd.to_numeric(series, errors="coerce").astype("Float64")
+    failed = series.notna() & (
+        numbers.isna()
+        | (numbers % 1 != 0)
+        | (numbers < INT32_MIN)
+        | (numbers > INT32_MAX)
+    ).fillna(True)
+    return numbers.mask(failed).astype(MONEY_DTYPE), failed
+
+
+def parse_id(value) -> Optional[bytes]:
+    """
+    Parse an employee ID into its 16-byte binary form.
+
+    Args:
+        value: A UUID string, 16 bytes, or a UUID instance.
+
+    Returns:
+        Optional[bytes]: The UUID's bytes, or None if the value is not a valid UUID.
+    """
+    if isinstance(value, uuid.UUID):
+        return value.bytes
+    if isinstance(value, bytes) and len(value) == 16:
+        return value
+    try:
+        return uuid.UUID(str(value)).bytes
+    except ValueError:
+        return None
+
+
+def coerce_ids(series: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    Strictly coerce a column of employee IDs into compact 16-byte binary values.
+
+    Args:
+        series (pd.Series): The column to coerce.
+
+    Returns:
+        Tuple[pd.Series, pd.Series]: The coerced column, and a boolean Series marking
+        values that were present but are not valid UUIDs.
+    """
+    if series.dtype == ID_DTYPE:
+        return series, pd.Series(False, index=series.index)
+    present = series.notna()
+    ids = [
+        parse_id(value) if is_present else None
+        for value, is_present in zip(series, present)
+    ]
+    coerced = pd.Series(pd.array(ids, dtype=ID_DTYPE), index=series.index)
+    return coerced, present & coerced.isna()
+
+
+def coerce_strings(series: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    Coerce a column into Arrow-backed strings.
+
+    Args:
+        series (pd.Series): The column to coerce.
+
+    Returns:
+        Tuple[pd.Series, pd.Series]: The coerced column, and a boolean Series of failures
+        (always False, since any value can be represented as a string).
+    """
+    return series.astype(STRING_DTYPE), pd.Series(False, index=series.index)
+
+
+COERCIONS = {
+    MONEY_DTYPE: coerce_money,
+    STRING_DTYPE: coerce_strings,
+    ID_DTYPE: coerce_ids,
+}
+
+
+def apply_schema(df: pd.DataFrame, schema: Schema) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Coerce the columns of a DataFrame to the dtypes of a schema.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to coerce.
+        schema (Schema): A mapping of column names to dtypes. Columns missing from `df` are skipped.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The coerced DataFrame, and a table of failed
+        coercions with 'row', 'column' and 'value' columns.
+    """
+    df = df.copy()
+    failures = []
+    for column, dtype in schema.items():
+        if column not in df.columns:
+            continue
+        original = df[column]
+        df[column], failed = COERCIONS[dtype](original)
+        failures.append(
+            pd.DataFrame(
+                {
+                    "row": original.index[failed],
+                    "column": column,
+                    "value": original[failed].astype(object),
+                }
+            )
+        )
+    failures = [failure for failure in failures if not failure.empty]
+    if failures:
+        return df, pd.concat(failures, ignore_index=True)
+    return df, pd.DataFrame(columns=["row", "column", "value"])
+
+
+def report_coercion_failures(failures: pd.DataFrame, source: str) -> None:
+    """
+    Log the rows that failed schema coercion.
+
+    Args:
+        failures (pd.DataFrame): A table of failed coercions, as returned by `apply_schema`.
+        source (str): A description of where the data came from (e.g., a file name).
+    """
+    if failures.empty:
+        return
+    logging.warning(
+        f"{len(failures)} value(s) in {source} failed schema coercion "
+        f"and were set to missing:\n{failures.to_string(index=False)}"
+    )
+
+
+def format_ids(series: pd.Series) -> pd.Series:
+    """
+    Convert binary employee IDs into canonical UUID strings.
+
+    Args:
+        series (pd.Series): A column of 16-byte binary IDs.
+
+    Returns:
+        pd.Series: The IDs as Arrow-backed strings.
+    """
+    return pd.Series(
+        [None if pd.isna(value) else str(uuid.UUID(bytes=value)) for value in series],
+        index=series.index,
+        dtype=STRING_DTYPE,
+    )
+
+
+def read_csv(
+    path: Path, schema: Schema, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Read a CSV file and coerce it to a schema, reporting values that fail coercion.
+
+    Args:
+        path (Path): The CSV file to read.
+        schema (Schema): A mapping of column names to dtypes.
+        columns (Optional[List[str]]): A subset of columns to read, or None for all columns.
+
+    Returns:
+        pd.DataFrame: The coerced DataFrame.
+
+    Note:
+        - Schema columns are read as strings, so pandas never re-infers their types.
+    """
+    df = pd.read_csv(
+        path, usecols=columns, dtype={column: STRING_DTYPE for column in schema}
+    )
+    df, failures = apply_schema(df, schema)
+    report_coercion_failures(failures, source=str(path))
+    return df
+
+
+def to_csv(df: pd.DataFrame, path: Path, schema: Schema) -> None:
+    """
+    Coerce a DataFrame to a schema and write it to a CSV file.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to write.
+        path (Path): The destination CSV file.
+        schema (Schema): A mapping of column names to dtypes.
+
+    Note:
+        - Binary IDs are written as canonical UUID strings.
+    """
+    df, failures = apply_schema(df, schema)
+    report_coercion_failures(failures, source=str(path))
+    for column, dtype in schema.items():
+        if dtype == ID_DTYPE and column in df.columns:
+            df[column] = format_ids(df[column])
+    df.to_csv(path, index=False)
+
+
+def compare_memory_footprint(path: Path, schema: Schema) -> pd.DataFrame:
+    """
+    Compare the memory footprint of a CSV file read with inferred dtypes and with a schema.
+
+    Args:
+        path (Path): The CSV file to read.
+        schema (Schema): A mapping of column names to dtypes.
+
+    Returns:
+        pd.DataFrame: Per-column memory usage in bytes, with 'inferred' and 'schema' columns.
+    """
+    inferred = pd.read_csv(path).memory_usage(deep=True, index=False)
+    coerced = read_csv(path, schema).memory_usage(deep=True, index=False)
+    comparison = pd.DataFrame({"inferred": inferred, "schema": coerced})
+    comparison.loc["total"] = comparison.sum()
+    comparison["ratio"] = comparison["schema"] / comparison["inferred"]
+    return comparison
+
+
+if __name__ == "__main__":
+    print(compare_memory_footprint(REMUNERATIONS_FILE, REMUNERATIONS))
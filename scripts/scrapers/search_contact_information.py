@@ -4,22 +4,32 @@
 # 3. Only first and last name
 
 # Loading Libraries
+import os
 import re
+import sys
 import json
+import click
+import socket
 import asyncio
 import logging
-import pandas as pd
+import work_queue
 
 from pathlib import Path
 from bs4 import BeautifulSoup
+from contextlib import closing
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
 from operator import itemgetter
-from collections import defaultdict
 from playwright.async_api import async_playwright
 
+sys.path.append(str(Path(__file__).parents[1]))
+from schema import REMUNERATIONS, format_ids, read_csv  # noqa: E402
+
 # Constants
 DATA = Path(__file__).parents[2] / "data"
 EMPLOYEES = DATA / "tmp" / "raw_employees.json"
 DIRECTORY_URL = "https://directory.ubc.ca/index.cfm"
+QUEUED_COLUMNS = ["id", "given_name", "surname"]
+POLL_SECONDS = 2  # How often an idle worker checks the work queue for released leases
 
 
 # Configure logging
@@ -150,58 +160,430 @@ def build_query_name(given_name, surname):
     return f"{first_name} {surname}"
 
 
-async def scrape_employee_info(page, given_name, surname):
+async def fetch_employee_page(page, given_name, surname):
+    """
+    Search for an employee and return the raw HTML of the results page.
+
+    Args:
+        page (Page): An instance of a Playwright Page navigated to the UBC directory website.
+        given_name (str): The employee's given name(s).
+        surname (str): The employee's surname.
+
+    Returns:
+        str: The HTML content of the search results page, or None if no match was found.
+
+    Description:
+        After the search, the function waits briefly and resets the page to the directory
+        home page so that it is ready for the next employee.
+    """
     query_name = build_query_name(given_name, surname)
 
     await search_employee(page, query_name)
 
+    html = None
     if await employee_match_found(page):
-        logging.info(f"Parsing HTML for {query_name}.")
-        soup = BeautifulSoup(await page.content(), "html.parser")
-        results_table = parse_results(soup)
-        if results_table:
-            return results_table
+        html = await page.content()
+    else:
+        logging.warning(f"No matches for {query_name}")
+
+    logging.info("Preparing for next employee.")
+    await asyncio.sleep(2)
+    await reset_page(page)
+    return html
 
-    logging.warning(f"No matches for {query_name}")
-    return None
 
+def parse_employee_page(html):
+    """
+    Parse the raw HTML of a search results page into result rows.
 
-async def scrape_employees(page, employee_names):
-    results = defaultdict(list)
-    for _, (id, given_name, surname) in employee_names.iterrows():
-        results_table = await scrape_employee_info(page, given_name, surname)
-        if results_table:
-            results[id] = results_table
+    Args:
+        html (str): The HTML content of a UBC directory search results page.
 
-        logging.info("Preparing for next employee.")
-        await asyncio.sleep(2)
-        await reset_page(page)
+    Returns:
+        list: A list of lists containing the parsed data for each result row, or None if there are none.
 
-    return results
+    Note:
+        - This function runs in a separate process, so it only takes and returns picklable values.
+    """
+    return parse_results(BeautifulSoup(html, "html.parser")) or None
 
 
-# Main Function
-async def main(start, end):
-    logging.info("Initiating employee directory scraping.")
-    employee_names = pd.read_csv(DATA / "processed" / "all_remunerations.csv").loc[
-        start:end, ["id", "given_name", "surname"]
-    ]
+def report_failed_employees(connection):
+    """
+    Log the employees that the work queue gave up on.
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False, slow_mo=100)
-        context = await browser.new_context()
-        page = await context.new_page()
-        await page.goto(DIRECTORY_URL)
+    Args:
+        connection (sqlite3.Connection): A work queue connection.
 
-        results = await scrape_employees(page, employee_names)
-        await browser.close()
-    return results
+    Description:
+        Employees are given up on once they have been leased `work_queue.MAX_ATTEMPTS`
+        times without a result. They are never leased or collected again.
+    """
+    failed = work_queue.failed_employees(connection)
+    if failed:
+        names = ", ".join(
+            f"{id} ({given_name} {surname})" for id, given_name, surname in failed
+        )
+        logging.warning(f"{len(failed)} employees failed to scrape: {names}")
 
 
-if __name__ == "__main__":
-    START, END = 0, 1
-    logging.info(f"Employee window: {START}, {END}")
-    results = asyncio.run(main(start=START, end=END))
+def report_unqueued_employees(employees):
+    """
+    Log the employees that cannot be queued for scraping.
+
+    Args:
+        employees (pd.DataFrame): Processed remuneration rows missing an 'id', 'given_name' or 'surname'.
+
+    Description:
+        Without an ID, results cannot be keyed in `EMPLOYEES`; without both names, no
+        directory query can be built. These rows are skipped rather than queued.
+    """
+    if employees.empty:
+        return
+    missing = employees[QUEUED_COLUMNS].isna()
+    rows = ", ".join(
+        f"row {row} ({name}; missing {', '.join(missing.columns[missing.loc[row]])})"
+        for row, name in employees["name"].items()
+    )
+    logging.warning(f"{len(employees)} employees were not queued: {rows}")
+
+
+def queue_runner(executor, connection):
+    """
+    Build a coroutine function that runs work queue calls in a dedicated thread.
+
+    Args:
+        executor (ThreadPoolExecutor): A single-threaded executor that owns `connection`.
+        connection (sqlite3.Connection): A work queue connection opened in that thread.
+
+    Returns:
+        Callable: A coroutine function taking a `work_queue` function and its arguments
+        (without the connection), e.g., `await queue(work_queue.remaining)`.
+    """
+
+    async def queue(function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, function, connection, *args)
+
+    return queue
+
+
+async def heartbeat_leases(queue, worker_id, lease_seconds):
+    """
+    Periodically extend the leases held by a worker until cancelled.
+
+    Args:
+        queue (Callable): Runs work queue calls off the event loop (see `queue_runner`).
+        worker_id (str): The worker's identifier.
+        lease_seconds (float): How long each lease lasts without a heartbeat.
+    """
+    while True:
+        await asyncio.sleep(lease_seconds / 3)
+        await queue(work_queue.heartbeat, worker_id, lease_seconds)
+
+
+# Pipeline Stages
+async def lease_employees(
+    queue, worker_id, batch_size, lease_seconds, employees, fetch_workers
+):
+    """
+    Lease employees from the work queue and feed them to the fetch stage.
+
+    Args:
+        queue (Callable): Runs work queue calls off the event loop (see `queue_runner`).
+        worker_id (str): The worker's identifier.
+        batch_size (int): The number of employees to lease at a time.
+        lease_seconds (float): How long each lease lasts without a heartbeat.
+        employees (asyncio.Queue): The bounded queue of (id, given_name, surname) tuples to fetch.
+        fetch_workers (int): The number of fetch workers to signal once the queue is drained.
+    """
+    while True:
+        leased = await queue(
+            work_queue.acquire_leases, worker_id, batch_size, lease_seconds
+        )
+        if leased:
+            for employee in leased:
+                await employees.put(employee)
+        elif await queue(work_queue.remaining):
+            # Leases are still in flight, here or in other workers; poll in case they
+            # are released or expire.
+            await asyncio.sleep(POLL_SECONDS)
+        else:
+            break
+
+    for _ in range(fetch_workers):
+        await employees.put(None)
+
+
+async def fetch_pages(context, queue, worker_id, employees, pages):
+    """
+    Fetch search results pages with a dedicated browser page.
+
+    Args:
+        context (BrowserContext): The Playwright browser context to open a page in.
+        queue (Callable): Runs work queue calls off the event loop (see `queue_runner`).
+        worker_id (str): The worker's identifier.
+        employees (asyncio.Queue): The bounded queue of (id, given_name, surname) tuples to fetch.
+        pages (asyncio.Queue): The bounded queue of (id, html) tuples to parse.
+
+    Description:
+        If a fetch fails, the employee is released back to the work queue and the page is
+        reloaded before moving on to the next employee. If the reload fails too, the error
+        propagates and stops the whole pipeline (see `run_pipeline`).
+    """
+    page = await context.new_page()
+    await page.goto(DIRECTORY_URL)
+
+    while (employee := await employees.get()) is not None:
+        id, given_name, surname = employee
+        try:
+            html = await fetch_employee_page(page, given_name, surname)
+        except Exception as e:
+            logging.error(f"Scraping failed for {id}: {e}")
+            await queue(work_queue.release, worker_id, id)
+            await page.goto(DIRECTORY_URL)
+            continue
+        await pages.put((id, html))
+
+    await page.close()
+
+
+async def parse_pages(executor, queue, worker_id, pages, results):
+    """
+    Parse fetched pages in a process pool.
+
+    Args:
+        executor (ProcessPoolExecutor): The pool that runs `parse_employee_page`.
+        queue (Callable): Runs work queue calls off the event loop (see `queue_runner`).
+        worker_id (str): The worker's identifier.
+        pages (asyncio.Queue): The bounded queue of (id, html) tuples to parse.
+        results (asyncio.Queue): The bounded queue of (id, results_table) tuples to persist.
+
+    Description:
+        If a page fails to parse, the employee is released back to the work queue. A broken
+        process pool is not recoverable, so its error propagates and stops the pipeline.
+    """
+    loop = asyncio.get_running_loop()
+    while (fetched := await pages.get()) is not None:
+        id, html = fetched
+        results_table = None
+        if html is not None:
+            logging.info(f"Parsing HTML for {id}.")
+            try:
+                results_table = await loop.run_in_executor(
+                    executor, parse_employee_page, html
+                )
+            except BrokenExecutor:
+                raise
+            except Exception as e:
+                logging.error(f"Parsing failed for {id}: {e}")
+                await queue(work_queue.release, worker_id, id)
+                continue
+        await results.put((id, results_table))
+
+
+async def persist_results(queue, worker_id, results):
+    """
+    Record parsed results in the work queue.
+
+    Args:
+        queue (Callable): Runs work queue calls off the event loop (see `queue_runner`).
+        worker_id (str): The worker's identifier.
+        results (asyncio.Queue): The bounded queue of (id, results_table) tuples to persist.
+
+    Note:
+        - There is a single writer, since SQLite serializes writes anyway.
+    """
+    while (parsed := await results.get()) is not None:
+        id, results_table = parsed
+        if not await queue(work_queue.complete, worker_id, id, results_table):
+            logging.warning(f"Lease on {id} expired; discarding result.")
+
+
+async def run_pipeline(
+    context,
+    executor,
+    queue,
+    worker_id,
+    batch_size,
+    lease_seconds,
+    fetch_workers,
+    parse_workers,
+    queue_size,
+):
+    """
+    Run the lease, fetch, parse and persist stages until the work queue is drained.
+
+    Args:
+        context (BrowserContext): The Playwright browser context for the fetch stage.
+        executor (ProcessPoolExecutor): The pool for the parse stage.
+        queue (Callable): Runs work queue calls off the event loop (see `queue_runner`).
+        worker_id (str): The worker's identifier.
+        batch_size (int): The number of employees to lease at a time.
+        lease_seconds (float): How long each lease lasts without a heartbeat.
+        fetch_workers (int): The number of concurrent fetch workers.
+        parse_workers (int): The number of concurrent parse workers.
+        queue_size (int): The maximum number of items buffered between stages.
+
+    Description:
+        All stages, including the lease heartbeat, run in one task group. If any of them
+        raises, the others are cancelled and the error propagates to the caller, which
+        releases the leases still held.
+    """
+    # Bounded queues between stages provide backpressure
+    employees = asyncio.Queue(maxsize=queue_size)
+    pages = asyncio.Queue(maxsize=queue_size)
+    results = asyncio.Queue(maxsize=queue_size)
+
+    async with asyncio.TaskGroup() as stages:
+        heartbeat = stages.create_task(
+            heartbeat_leases(queue, worker_id, lease_seconds)
+        )
+        lessor = stages.create_task(
+            lease_employees(
+                queue,
+                worker_id,
+                batch_size,
+                lease_seconds,
+                employees,
+                fetch_workers,
+            )
+        )
+        fetchers = [
+            stages.create_task(fetch_pages(context, queue, worker_id, employees, pages))
+            for _ in range(fetch_workers)
+        ]
+        parsers = [
+            stages.create_task(parse_pages(executor, queue, worker_id, pages, results))
+            for _ in range(parse_workers)
+        ]
+        writer = stages.create_task(persist_results(queue, worker_id, results))
+
+        # Shut the stages down in order, once each upstream stage has drained
+        await lessor
+        await asyncio.gather(*fetchers)
+        for _ in range(parse_workers):
+            await pages.put(None)
+        await asyncio.gather(*parsers)
+        await results.put(None)
+        await writer
+        heartbeat.cancel()
+
+
+# Main Function
+async def work(
+    worker_id, batch_size, lease_seconds, fetch_workers, parse_workers, queue_size
+):
+    logging.info(f"Initiating employee directory scraping as worker {worker_id}.")
+
+    # A single thread owns the work queue connection, so blocking SQLite calls (e.g.,
+    # waiting on another worker's write lock) never stall the event loop
+    with ThreadPoolExecutor(max_workers=1) as queue_executor:
+        loop = asyncio.get_running_loop()
+        connection = await loop.run_in_executor(queue_executor, work_queue.connect)
+        queue = queue_runner(queue_executor, connection)
+        try:
+            with ProcessPoolExecutor(max_workers=parse_workers) as executor:
+                async with async_playwright() as p:
+                    browser = await p.chromium.launch(headless=False, slow_mo=100)
+                    try:
+                        context = await browser.new_context()
+                        await run_pipeline(
+                            context,
+                            executor,
+                            queue,
+                            worker_id,
+                            batch_size,
+                            lease_seconds,
+                            fetch_workers,
+                            parse_workers,
+                            queue_size,
+                        )
+                    finally:
+                        await browser.close()
+        finally:
+            released = await queue(work_queue.release_leases, worker_id)
+            if released:
+                logging.warning(
+                    f"Released {released} leases held by worker {worker_id}."
+                )
+            await queue(report_failed_employees)
+            await loop.run_in_executor(queue_executor, connection.close)
+
+    logging.info(f"Worker {worker_id} found no remaining employees.")
+
+
+@click.group()
+def main():
+    pass
+
+
+@main.command()
+def enqueue():
+    """Queue every processed employee for scraping."""
+    employees = read_csv(
+        DATA / "processed" / "all_remunerations.csv",
+        schema=REMUNERATIONS,
+        columns=["id", "name", "given_name", "surname"],
+    )
+    incomplete = employees[QUEUED_COLUMNS].isna().any(axis=1)
+    report_unqueued_employees(employees[incomplete])
+    employees = employees.loc[~incomplete, QUEUED_COLUMNS]
+    employees["id"] = format_ids(employees["id"])
+    with closing(work_queue.connect()) as connection:
+        added = work_queue.enqueue(connection, employees.itertuples(index=False))
+    logging.info(f"Queued {added} employees.")
+
+
+@main.command(name="work")
+@click.option("--worker-id", default=f"{socket.gethostname()}-{os.getpid()}")
+@click.option("--batch-size", type=int, default=5, show_default=True)
+@click.option(
+    "--lease-seconds", type=float, default=work_queue.LEASE_SECONDS, show_default=True
+)
+@click.option(
+    "--fetch-workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Browser pages fetching search results concurrently.",
+)
+@click.option(
+    "--parse-workers",
+    type=int,
+    default=2,
+    show_default=True,
+    help="Processes parsing fetched HTML concurrently.",
+)
+@click.option(
+    "--queue-size",
+    type=int,
+    default=10,
+    show_default=True,
+    help="Maximum items buffered between pipeline stages.",
+)
+def work_command(
+    worker_id, batch_size, lease_seconds, fetch_workers, parse_workers, queue_size
+):
+    """Lease employees from the queue and scrape them until none remain."""
+    asyncio.run(
+        work(
+            worker_id,
+            batch_size,
+            lease_seconds,
+            fetch_workers,
+            parse_workers,
+            queue_size,
+        )
+    )
+
+
+@main.command()
+def collect():
+    """Merge completed results into the raw employees JSON file."""
+    with closing(work_queue.connect()) as connection:
+        results = work_queue.collect_results(connection)
+        report_failed_employees(connection)
 
     with EMPLOYEES.open(mode="r") as f:
         employees = json.load(f)
@@ -209,3 +591,8 @@ if __name__ == "__main__":
     with EMPLOYEES.open(mode="w") as f:
         employees.update(results)
         json.dump(employees, f)
+    logging.info(f"Collected {len(results)} employees.")
+
+
+if __name__ == "__main__":
+    main()
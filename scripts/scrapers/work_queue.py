@@ -0,0 +1,297 @@
+# Loading Libraries
+import json
+import time
+import sqlite3
+
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Constants
+DATA = Path(__file__).parents[2] / "data"
+QUEUE = DATA / "tmp" / "scraping_queue.sqlite"
+LEASE_SECONDS = 120
+MAX_ATTEMPTS = 3
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS employees (
+    id TEXT PRIMARY KEY,
+    given_name TEXT NOT NULL,
+    surname TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker_id TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS employees_status ON employees (status, lease_expires);
+"""
+
+
+# Helper Functions
+def connect(path: Path = QUEUE) -> sqlite3.Connection:
+    """
+    Open the work queue database, creating it if needed.
+
+    Args:
+        path (Path): The path to the SQLite database.
+
+    Returns:
+        sqlite3.Connection: A connection in autocommit mode.
+
+    Description:
+        The database uses write-ahead logging so that many worker processes can read
+        while one of them holds the write lock. Since the connection is in autocommit
+        mode, writes that must be atomic go through `transaction`.
+    """
+    connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+@contextmanager
+def transaction(connection: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Run a block of statements in a single write transaction.
+
+    Args:
+        connection (sqlite3.Connection): A work queue connection.
+
+    Yields:
+        sqlite3.Connection: The same connection, holding the database write lock.
+
+    Description:
+        The transaction is opened with `BEGIN IMMEDIATE`, so the write lock is taken up
+        front. It is committed if the block succeeds and rolled back otherwise.
+    """
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+def enqueue(
+    connection: sqlite3.Connection, employees: Iterable[Tuple[str, str, str]]
+) -> int:
+    """
+    Atomically add employees to the work queue, ignoring those already queued.
+
+    Args:
+        connection (sqlite3.Connection): A work queue connection.
+        employees (Iterable[Tuple[str, str, str]]): (id, given_name, surname) tuples.
+
+    Returns:
+        int: The number of employees added.
+    """
+    with transaction(connection):
+        cursor = connection.executemany(
+            "INSERT OR IGNORE INTO employees (id, given_name, surname) VALUES (?, ?, ?)",
+            employees,
+        )
+    return cursor.rowcount
+
+
+def acquire_leases(
+    connection: sqlite3.Connection,
+    worker_id: str,
+    batch_size: int,
+    lease_seconds: float = LEASE_SECONDS,
+) -> List[Tuple[str, str, str]]:
+    """
+    Lease a batch of pending employees to a worker.
+
+    Args:
+        connection (sqlite3.Connection): A work queue connection.
+        worker_id (str): A unique identifier for the worker.
+        batch_size (int): The maximum number of employees to lease.
+        lease_seconds (float): How long the lease lasts without a heartbeat.
+
+    Returns:
+        List[Tuple[str, str, str]]: The leased (id, given_name, surname) tuples.
+
+    Description:
+        Pending employees and employees whose lease has expired (e.g., because their
+        worker died) are both eligible. Eligible employees that have already been
+        leased `MAX_ATTEMPTS` times are marked as failed instead (see `failed_employees`).
+        Leasing happens in a single write transaction, so no two workers can lease the
+        same employee.
+    """
+    now = time.time()
+    with transaction(connection):
+        connection.execute(
+            """
+            UPDATE employees SET status = ?, worker_id = NULL, lease_expires = NULL
+            WHERE (status = ? OR (status = ? AND lease_expires < ?))
+              AND attempts >= ?
+            """,
+            (FAILED, PENDING, LEASED, now, MAX_ATTEMPTS),
+        )
+        employees = connection.execute(
+            """
+            SELECT id, given_name, surname FROM employees
+            WHERE status = ? OR (status = ? AND lease_expires < ?)
+            LIMIT ?
+            """,
+            (PENDING, LEASED, now, batch_size),
+        ).fetchall()
+        connection.executemany(
+            """
+            UPDATE employees
+            SET status = ?, worker_id = ?, lease_expires = ?, attempts = attempts + 1
+            WHERE id = ?
+            """,
+            [(LEASED, worker_id, now + lease_seconds, id) for id, _, _ in employees],
+        )
+    return employees
+
+
+def heartbeat(
+    connection: sqlite3.Connection, worker_id: str, lease_seconds: float = LEASE_SECONDS
+) -> int:
+    """
+    Extend all leases held by a worker.
+
+    Args:
+        connection (sqlite3.Connection): A work queue connection.
+        worker_id (str): The worker's identifier.
+        lease_seconds (float): How long the leases last from now.
+
+    Returns:
+        int: The number of leases extended.
+    """
+    with transaction(connection):
+        cursor = connection.execute(
+            "UPDATE employees SET lease_expires = ? WHERE status = ? AND worker_id = ?",
+            (time.time() + lease_seconds, LEASED, worker_id),
+        )
+    return cursor.rowcount
+
+
+def complete(
+    connection: sqlite3.Connection,
+    worker_id: str,
+    employee_id: str,
+    result: Optional[List[List[str]]],
+) -> bool:
+    """
+    Record a worker's result for a leased employee.
+
+    Args:
+        connection (sqlite3.Connection): A work queue connection.
+        worker_id (str): The worker's identifier.
+        employee_id (str): The employee's ID.
+        result (Optional[List[List[str]]]): The parsed search results, or None if there were no matches.
+
+    Returns:
+        bool: True if the result was recorded, False if the worker no longer holds the lease.
+    """
+    with transaction(connection):
+        cursor = connection.execute(
+            """
+            UPDATE employees
+            SET status = ?, worker_id = NULL, lease_expires = NULL, result = ?
+            WHERE id = ? AND status = ? AND worker_id = ?
+            """,
+            (DONE, json.dumps(result), employee_id, LEASED, worker_id),
+        )
+    return cursor.rowcount == 1
+
+
+def release(connection: sqlite3.Connection, worker_id: str, employee_id: str) -> None:
+    """
+    Return a leased employee to the queue, e.g., after a failed scrape.
+
+    Args:
+        connection (sqlite3.Connection): A work queue connection.
+        worker_id (str): The worker's identifier.
+        employee_id (str): The employee's ID.
+    """
+    with transaction(connection):
+        connection.execute(
+            """
+            UPDATE employees SET status = ?, worker_id = NULL, lease_expires = NULL
+            WHERE id = ? AND status = ? AND worker_id = ?
+            """,
+            (PENDING, employee_id, LEASED, worker_id),
+        )
+
+
+def release_leases(connection: sqlite3.Connection, worker_id: str) -> int:
+    """
+    Return every employee leased by a worker to the queue, e.g., when the worker stops.
+
+    Args:
+        connection (sqlite3.Connection): A work queue connection.
+        worker_id (str): The worker's identifier.
+
+    Returns:
+        int: The number of leases released.
+    """
+    with transaction(connection):
+        cursor = connection.execute(
+            """
+            UPDATE employees SET status = ?, worker_id = NULL, lease_expires = NULL
+            WHERE status = ? AND worker_id = ?
+            """,
+            (PENDING, LEASED, worker_id),
+        )
+    return cursor.rowcount
+
+
+def remaining(connection: sqlite3.Connection) -> int:
+    """
+    Count the employees that may still be leased.
+
+    Args:
+        connection (sqlite3.Connection): A work queue connection.
+
+    Returns:
+        int: The number of pending or leased employees.
+    """
+    (count,) = connection.execute(
+        "SELECT COUNT(*) FROM employees WHERE status IN (?, ?)",
+        (PENDING, LEASED),
+    ).fetchone()
+    return count
+
+
+def failed_employees(connection: sqlite3.Connection) -> List[Tuple[str, str, str]]:
+    """
+    List the employees that were given up on after `MAX_ATTEMPTS` leases.
+
+    Args:
+        connection (sqlite3.Connection): A work queue connection.
+
+    Returns:
+        List[Tuple[str, str, str]]: The failed (id, given_name, surname) tuples.
+    """
+    return connection.execute(
+        "SELECT id, given_name, surname FROM employees WHERE status = ?",
+        (FAILED,),
+    ).fetchall()
+
+
+def collect_results(connection: sqlite3.Connection) -> Dict[str, Any]:
+    """
+    Collect the results of all completed employees that had matches.
+
+    Args:
+        connection (sqlite3.Connection): A work queue connection.
+
+    Returns:
+        Dict[str, Any]: A dictionary mapping employee IDs to their parsed search results.
+    """
+    rows = connection.execute(
+        "SELECT id, result FROM employees WHERE status = ? AND result != 'null'",
+        (DONE,),
+    )
+    return {id: json.loads(result) for id, result in rows}